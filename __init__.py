@@ -0,0 +1,5 @@
+"""
+CV AI Agent - Flask application package.
+Import the factory as cv_ai_agent.app.create_app; the Gunicorn entry point
+is cv_ai_agent.wsgi:application.
+"""
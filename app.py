@@ -4,57 +4,130 @@ Updated to integrate centralized environment configuration loader.
 """
 
 import os
+import time
 import logging
 import logging.config
-from pathlib import Path
-from flask import Flask, jsonify, request
+import orjson
+from flask import Flask, request
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.exceptions import HTTPException
 from .config import DevelopmentConfig, TestingConfig, ProductionConfig
 
+# Application logger, looked up once and shared by setup and request hooks
+logger = logging.getLogger("app")
+
 
 # ====================
 # LOGGING CONFIGURATION
 # ====================
 
+_LOGGING_DICT = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        # Production format: timestamp, level, logger name, module, line number, message
+        "detailed": {
+            "format": "%(asctime)s.%(msecs)03d [%(levelname)-8s] %(name)s:%(filename)s:%(lineno)d - %(message)s",
+            "datefmt": "%Y-%m-%d %H:%M:%S",
+        },
+        # Simplified format for less verbose output
+        "simple": {
+            "format": "[%(levelname)s] %(name)s - %(message)s",
+            "datefmt": "%H:%M:%S",
+        },
+        # Gunicorn access log format (message already carries the CLF line)
+        "access": {
+            "format": "%(message)s",
+        },
+        # JSON format for structured logging (compatible with log aggregators)
+        "json": {
+            "format": '{"timestamp": "%(asctime)s", "level": "%(levelname)s", "logger": "%(name)s", '
+                      '"message": "%(message)s", "module": "%(module)s", "function": "%(funcName)s"}',
+            "datefmt": "%Y-%m-%dT%H:%M:%S",
+        },
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+            "level": "INFO",
+            "formatter": "detailed",
+            "stream": "ext://sys.stdout",
+        },
+        # Separate error stream handler for stderr
+        "error_console": {
+            "class": "logging.StreamHandler",
+            "level": "WARNING",
+            "formatter": "detailed",
+            "stream": "ext://sys.stderr",
+        },
+        # Access log handler (simplified format)
+        "access_console": {
+            "class": "logging.StreamHandler",
+            "level": "INFO",
+            "formatter": "access",
+            "stream": "ext://sys.stdout",
+        },
+        # A file handler can be added here, e.g.:
+        # "file_handler": {"class": "logging.FileHandler", "level": "INFO",
+        #                  "formatter": "detailed", "filename": "/var/log/cv_ai_agent/app.log"}
+    },
+    "loggers": {
+        # Application logger - for Flask app specific logs
+        "app": {"level": "INFO", "handlers": ["console"], "propagate": False},
+        # Gunicorn error logger - handles server errors
+        "gunicorn.error": {"level": "INFO", "handlers": ["error_console"], "propagate": False},
+        # Gunicorn access logger - HTTP request logs
+        "gunicorn.access": {"level": "INFO", "handlers": ["access_console"], "propagate": False},
+    },
+    "root": {"level": "INFO", "handlers": ["console"]},
+}
+
+_LOGGING_CONFIGURED = False
+
+
 def setup_logging(level=None):
     """
-    Initialize logging configuration from logging.conf.
-    Falls back to basic config if file not found.
-    Uses level from configuration if provided.
+    Initialize logging configuration from _LOGGING_DICT.
+    Only configures logging once per process; later calls return the app logger.
+    Falls back to basic config if the dict config cannot be applied.
     """
-    try:
-        config_path = Path(__file__).parent / 'logging.conf'
-        if config_path.exists():
-            logging.config.fileConfig(config_path, disable_existing_loggers=False)
-            logger = logging.getLogger("app")
-            logger.info(f"Loaded logging configuration from: {config_path}")
-        else:
-            logging.basicConfig(
-                level=level or logging.INFO,
-                format='%(asctime)s [%(levelname)s] %(name)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            logger = logging.getLogger("app")
-            logger.warning(f"logging.conf not found at {config_path}, using basic logging")
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
         return logger
+
+    try:
+        logging.config.dictConfig(_LOGGING_DICT)
+        logger.info("Loaded logging configuration")
     except Exception as e:
-        logging.basicConfig(level=logging.WARNING)
-        logger = logging.getLogger("app")
-        logger.error(f"Failed to setup logging: {str(e)}")
-        return logger
+        logging.basicConfig(
+            level=level or logging.INFO,
+            format='%(asctime)s [%(levelname)s] %(name)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        logger.error("Failed to setup logging: %s", e)
+
+    _LOGGING_CONFIGURED = True
+    return logger
 
 # ====================
 # CONFIGURATION LOADER
 # ====================
 
-def get_config():
+def get_env_name():
+    """
+    Resolve the runtime environment name from FLASK_ENV or APP_ENV.
+    Defaults to "development".
+    """
+    return (os.environ.get("FLASK_ENV") or os.environ.get("APP_ENV", "development")).lower()
+
+
+def get_config(env=None):
     """
     Select configuration class based on environment variable:
     FLASK_ENV or APP_ENV (development, testing, production)
     Defaults to DevelopmentConfig.
     """
-    env = os.environ.get("FLASK_ENV") or os.environ.get("APP_ENV", "development")
-    env = env.lower()
+    env = env or get_env_name()
     if env == "production":
         return ProductionConfig
     elif env == "testing":
@@ -63,8 +136,110 @@ def get_config():
         return DevelopmentConfig
 
 # Initialize config and logging
-ConfigClass = get_config()
-logger = setup_logging(getattr(ConfigClass, "LOG_LEVEL", None))
+# The environment is resolved once here; nothing reads it per request
+ENV_NAME = get_env_name()
+ConfigClass = get_config(ENV_NAME)
+setup_logging(getattr(ConfigClass, "LOG_LEVEL", None))
+
+# ====================
+# STATIC PAYLOADS
+# ====================
+
+# These bodies never change for the life of a worker, so encode them once
+# at import time instead of rebuilding and re-serializing a dict per request.
+_HOME_BYTES = orjson.dumps({
+    "service": "CV AI Agent",
+    "version": "1.0.0",
+    "status": "operational",
+    "message": "Hello! I am your baby AI agent 🤖"
+})
+_HEALTH_BYTES = orjson.dumps({"status": "healthy"})
+_READY_BYTES = orjson.dumps({"ready": True})
+
+# Error bodies: fully static where possible, otherwise byte templates whose
+# slots are filled with orjson-encoded (and therefore escaped) values
+_NOT_FOUND_TMPL = b'{"error":"Not Found","message":"Resource does not exist","path":%s}'
+_INTERNAL_ERROR_BYTES = orjson.dumps({"error": "Internal Server Error", "message": "Unexpected error occurred"})
+_HTTP_ERROR_TMPL = b'{"error":%s,"message":%s,"code":%d}'
+
+# Tracebacks for unexpected errors are logged at most once per interval per
+# exception class, so an error storm cannot turn formatting into the bottleneck
+_TRACEBACK_INTERVAL = 1.0
+_LAST_TRACEBACK = {}
+
+# Service identification headers appended to every response
+_EXTRA_HEADERS = [("X-Service", "CV-AI-Agent"), ("X-Version", "1.0.0")]
+
+# Liveness/readiness probes answered directly at the WSGI layer, with their
+# complete headers prebuilt alongside the encoded body. Headers are kept as
+# tuples: PEP 3333 lets servers and middleware modify the list passed to
+# start_response, so each response gets its own copy. The short max-age
+# lets caching proxies/sidecars absorb probes polled faster than 1s.
+_PROBE_HEADERS = (
+    ("Content-Type", "application/json"),
+    ("Cache-Control", "max-age=1, public"),
+) + tuple(_EXTRA_HEADERS)
+_PROBE_RESPONSES = {
+    path: (body, _PROBE_HEADERS + (("Content-Length", str(len(body))),))
+    for path, body in (("/health", _HEALTH_BYTES), ("/ready", _READY_BYTES))
+}
+
+# ====================
+# JSON PROVIDER
+# ====================
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    Used by jsonify() and request.get_json() across every route.
+    Output is always compact; keys are only sorted if sort_keys is enabled.
+
+    date/datetime values are passed through to Flask's default() hook, so
+    they keep the stock HTTP-date format. Remaining differences from
+    DefaultJSONProvider:
+    - integers wider than 64 bits raise TypeError instead of serializing
+    - NaN and +/-Infinity serialize as null instead of NaN/Infinity
+    - non-ASCII text is emitted as raw UTF-8 instead of \\u escapes
+      (ensure_ascii is ignored)
+    - keyword arguments to dumps()/loads() (indent, separators, cls, ...)
+      are ignored
+    """
+    compact = True
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+# ====================
+# FLASK APPLICATION CLASS
+# ====================
+
+class CVAgentFlask(Flask):
+    """
+    Flask application with rate-limited traceback logging.
+    Flask's handle_exception() calls log_exception() with the full traceback
+    before the 500 handler runs; here the traceback is only formatted once
+    per _TRACEBACK_INTERVAL per exception class, other occurrences log a
+    single line.
+    """
+
+    def log_exception(self, exc_info):
+        exc_class = exc_info[0]
+        now = time.monotonic()
+        if now - _LAST_TRACEBACK.get(exc_class, 0.0) > _TRACEBACK_INTERVAL:
+            _LAST_TRACEBACK[exc_class] = now
+            super().log_exception(exc_info)
+        else:
+            self.logger.error(
+                "Exception on %s [%s]: %s (traceback suppressed)",
+                request.path, request.method, exc_info[1]
+            )
 
 # ====================
 # APPLICATION FACTORY
@@ -75,18 +250,22 @@ def create_app(config_class=None):
     Flask application factory.
     Automatically applies selected configuration and logging.
     """
-    app = Flask(__name__)
+    app = CVAgentFlask(__name__)
+
+    # Route all jsonify()/get_json() work through orjson (compact, unsorted)
+    app.json = ORJSONProvider(app)
 
     # Apply configuration
     config_class = config_class or ConfigClass
     try:
         app.config.from_object(config_class)
+        config_class.init_app(app)
     except RuntimeError as e:
-        logger.error(f"Failed to load configuration: {e}")
+        logger.error("Failed to load configuration: %s", e)
         raise
 
-    logger.info(f"Starting CV AI Agent with config: {config_class.__name__}")
-    logger.info(f"Environment: {os.environ.get('FLASK_ENV', os.environ.get('APP_ENV', 'development'))}")
+    logger.info("Starting CV AI Agent with config: %s", config_class.__name__)
+    logger.info("Environment: %s", ENV_NAME)
 
     # ====================
     # HEALTH & READINESS
@@ -94,69 +273,97 @@ def create_app(config_class=None):
     @app.route("/")
     def home():
         logger.debug("Root endpoint accessed")
-        return jsonify({
-            "service": "CV AI Agent",
-            "version": "1.0.0",
-            "status": "operational",
-            "message": "Hello! I am your baby AI agent 🤖"
-        })
+        return app.response_class(_HOME_BYTES, mimetype="application/json")
 
     @app.route("/health")
     def health_check():
         logger.debug("Health check requested")
-        return jsonify({"status": "healthy"}), 200
+        return app.response_class(_HEALTH_BYTES, mimetype="application/json")
 
     @app.route("/ready")
     def readiness_check():
         logger.debug("Readiness check requested")
-        return jsonify({"ready": True}), 200
+        return app.response_class(_READY_BYTES, mimetype="application/json")
 
     # ====================
     # ERROR HANDLERS
     # ====================
     @app.errorhandler(404)
     def not_found(error):
-        logger.warning(f"404 Not Found: {request.path}")
-        return jsonify({"error": "Not Found", "message": "Resource does not exist", "path": request.path}), 404
+        logger.warning("404 Not Found: %s", request.path)
+        body = _NOT_FOUND_TMPL % orjson.dumps(request.path)
+        return app.response_class(body, status=404, mimetype="application/json")
 
     @app.errorhandler(500)
     def internal_error(error):
-        logger.error(f"500 Internal Server Error: {error}", exc_info=True)
-        return jsonify({"error": "Internal Server Error", "message": "Unexpected error occurred"}), 500
+        # The traceback (if any) is logged by CVAgentFlask.log_exception
+        logger.error("500 Internal Server Error: %s", error)
+        return app.response_class(_INTERNAL_ERROR_BYTES, status=500, mimetype="application/json")
 
     @app.errorhandler(HTTPException)
     def handle_http_exception(error):
         if error.code >= 500:
-            logger.error(f"HTTP {error.code}: {error.name} - {error.description}")
+            logger.error("HTTP %s: %s - %s", error.code, error.name, error.description)
         elif error.code >= 400:
-            logger.warning(f"HTTP {error.code}: {error.name} - {error.description}")
-        return jsonify({"error": error.name, "message": error.description, "code": error.code}), error.code
+            logger.warning("HTTP %s: %s - %s", error.code, error.name, error.description)
+        body = _HTTP_ERROR_TMPL % (orjson.dumps(error.name), orjson.dumps(error.description), error.code)
+        return app.response_class(body, status=error.code, mimetype="application/json")
 
     # ====================
     # HOOKS
     # ====================
+    # Debug lines read method/path straight from the WSGI environ to skip
+    # the Request property chain, and are only formatted when enabled.
     @app.before_request
     def before_request():
-        logger.debug(f"Incoming request: {request.method} {request.path}")
+        if logger.isEnabledFor(logging.DEBUG):
+            env = request.environ
+            logger.debug("Incoming request: %s %s", env["REQUEST_METHOD"], env["PATH_INFO"])
 
     @app.after_request
     def after_request(response):
-        response.headers['X-Service'] = 'CV-AI-Agent'
-        response.headers['X-Version'] = '1.0.0'
-        if response.status_code >= 500:
-            logger.error(f"Response {response.status_code} for {request.method} {request.path}")
-        elif response.status_code >= 400:
-            logger.warning(f"Response {response.status_code} for {request.method} {request.path}")
+        response.headers.extend(_EXTRA_HEADERS)
+        status = response.status_code
+        if status < 400:
+            if logger.isEnabledFor(logging.DEBUG):
+                env = request.environ
+                logger.debug("Response %s for %s %s", status, env["REQUEST_METHOD"], env["PATH_INFO"])
+            return response
+
+        # Error paths are rare; use the decoded path so these lines match
+        # the ones logged by the error handlers
+        method, path = request.method, request.path
+        if status >= 500:
+            logger.error("Response %s for %s %s", status, method, path)
         else:
-            logger.debug(f"Response {response.status_code} for {request.method} {request.path}")
+            logger.warning("Response %s for %s %s", status, method, path)
         return response
 
+    # ====================
+    # PROBE SHORT-CIRCUIT
+    # ====================
+    # Load balancers and orchestrators poll /health and /ready constantly;
+    # answer GETs for them before Flask routing, hooks and error handling run.
+    inner_wsgi_app = app.wsgi_app
+
+    def probe_middleware(environ, start_response):
+        probe = _PROBE_RESPONSES.get(environ.get("PATH_INFO"))
+        if probe is not None and environ.get("REQUEST_METHOD") == "GET":
+            body, headers = probe
+            start_response("200 OK", list(headers))
+            return [body]
+        return inner_wsgi_app(environ, start_response)
+
+    app.wsgi_app = probe_middleware
+
     return app
 
 
 # ====================
 # ENTRY POINT
 # ====================
+# Run as a module (python -m cv_ai_agent.app); `python app.py` cannot
+# resolve the package-relative config import.
 if __name__ == "__main__":
     app = create_app()
     host = os.environ.get("HOST", "127.0.0.1")
@@ -164,4 +371,15 @@ if __name__ == "__main__":
     startup_msg = f"🚀 CV AI Agent starting on http://{host}:{port} ({ConfigClass.__name__})"
     print(startup_msg)
     logger.info(startup_msg)
-    app.run(host=host, port=port, debug=app.config.get("DEBUG", True))
+    if app.config.get("DEBUG", True):
+        app.run(host=host, port=port, debug=True)
+    else:
+        # The Werkzeug dev server is single-threaded and not meant for
+        # production traffic; hand off to waitress when not debugging
+        try:
+            from waitress import serve
+        except ImportError:
+            logger.warning("waitress not installed, falling back to the Werkzeug development server")
+            app.run(host=host, port=port, debug=False)
+        else:
+            serve(app, host=host, port=port, threads=int(os.environ.get("WAITRESS_THREADS", 8)))
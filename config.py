@@ -8,8 +8,8 @@ Provides:
 - ProductionConfig: production defaults (Docker, Gunicorn, CI/CD)
 
 Features:
-- Loads environment variables from system or .env file
-- Validates required environment variables
+- Loads environment variables from system or .env file (.env skipped in production)
+- Validates required environment variables when the app is created (init_app)
 - Provides default settings for host, port, debug, logging
 - Compatible with Windows/Linux, Docker, Gunicorn
 
@@ -17,16 +17,19 @@ Usage:
     from cv_ai_agent.config import DevelopmentConfig, TestingConfig, ProductionConfig
 
     app.config.from_object(DevelopmentConfig)
+    DevelopmentConfig.init_app(app)
 """
 
 import os
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Load .env file if it exists
-env_path = Path(__file__).parent.parent / ".env"
-if env_path.exists():
-    load_dotenv(dotenv_path=env_path)
+# Load .env file if it exists (production gets its variables from the
+# container orchestrator, so skip the file lookup and dotenv import there)
+if (os.getenv("FLASK_ENV") or os.getenv("APP_ENV", "development")).lower() != "production":
+    env_path = Path(__file__).parent.parent / ".env"
+    if env_path.exists():
+        from dotenv import load_dotenv
+        load_dotenv(dotenv_path=env_path)
 
 def require_env(var_name: str) -> str:
     """
@@ -54,14 +57,24 @@ class BaseConfig:
     PORT = int(os.getenv("PORT", "8000"))
     DEBUG = os.getenv("DEBUG", "False").lower() in ["true", "1", "yes"]
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-    
-    # Example: database URL, secret key
-    SECRET_KEY = require_env("SECRET_KEY")
-    DATABASE_URL = require_env("DATABASE_URL")
 
     # Optional settings with defaults
     MAX_CONTENT_LENGTH = int(os.getenv("MAX_CONTENT_LENGTH", 16 * 1024 * 1024))  # 16 MB
-    JSON_SORT_KEYS = os.getenv("JSON_SORT_KEYS", "False").lower() in ["true", "1", "yes"]
+
+    @classmethod
+    def init_app(cls, app):
+        """
+        Resolve required settings (secret key, database URL) on the app.
+
+        Runs from the application factory rather than at import time, so
+        importing this module never fails when the variables are absent.
+
+        Raises:
+            RuntimeError: if a required variable is not set
+        """
+        app.config["SECRET_KEY"] = require_env("SECRET_KEY")
+        if "DATABASE_URL" not in app.config:
+            app.config["DATABASE_URL"] = require_env("DATABASE_URL")
 
 
 class DevelopmentConfig(BaseConfig):
@@ -75,7 +88,16 @@ class TestingConfig(BaseConfig):
     TESTING = True
     DEBUG = True
     LOG_LEVEL = "DEBUG"
-    DATABASE_URL = os.getenv("TEST_DATABASE_URL", "sqlite:///:memory:")
+    # Unnamed shared-cache in-memory SQLite (uri=true enables URI filenames):
+    # every connection in the process sees the same database, so a schema only
+    # needs creating once per session. It is dropped when the last connection
+    # closes, so keep one open (SQLAlchemy: poolclass=StaticPool).
+    DATABASE_URL = os.getenv("TEST_DATABASE_URL", "sqlite:///file::memory:?cache=shared&uri=true")
+
+    @classmethod
+    def init_app(cls, app):
+        """Use a throwaway secret key so tests never need real secrets."""
+        app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "testing-secret-key")
 
 
 class ProductionConfig(BaseConfig):
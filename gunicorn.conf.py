@@ -25,18 +25,21 @@ try:
     cores = multiprocessing.cpu_count()
     default_workers = (2 * cores) + 1
 except:
+    cores = 1
     default_workers = 3  # Fallback for CPU count failure
 
 # Set worker count from environment or calculated default
-workers = int(os.environ.get('GUNICORN_WORKERS', default_workers))
+# WEB_CONCURRENCY is the conventional name used by PaaS platforms
+workers = int(os.environ.get('GUNICORN_WORKERS', os.environ.get('WEB_CONCURRENCY', default_workers)))
 
 # Worker type for Flask/IOLoop applications
-# sync: Traditional synchronous workers (safe default)
-# gthread: Thread-based workers for I/O bound apps
-worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+# sync: Traditional synchronous workers (one request at a time per worker)
+# gthread: Thread-based workers for I/O bound apps (default - endpoints here
+#          only serialize JSON and write logs/sockets)
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
 
 # Threads per worker (only for gthread worker class)
-threads = int(os.environ.get('GUNICORN_THREADS', 1))
+threads = int(os.environ.get('GUNICORN_THREADS', max(2, cores)))
 
 # ====================
 # TIMEOUT & KEEPALIVE
@@ -112,8 +115,13 @@ daemon = os.environ.get('GUNICORN_DAEMON', 'False').lower() == 'true'
 reload = os.environ.get('GUNICORN_RELOAD', 'False').lower() == 'true'
 
 # Preload application code before forking workers
-# Reduces memory usage but can cause issues with some libraries
-preload_app = os.environ.get('GUNICORN_PRELOAD', 'False').lower() == 'true'
+# wsgi.application is built once in the master; workers share the imported
+# app and pre-encoded payloads via copy-on-write, so boot cost is one
+# create_app() plus N forks. The app must not hold open sockets or database
+# connections at fork time - if a connection pool is added, dispose of it in
+# a post_fork(server, worker) hook so each worker opens its own.
+# Disable if a library misbehaves after fork.
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'True').lower() == 'true'
 
 # ====================
 # ENVIRONMENT VARIABLES
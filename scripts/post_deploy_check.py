@@ -16,9 +16,20 @@ Usage:
 import sys
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
+from requests.adapters import HTTPAdapter
 
-def check_endpoint(url: str, retries: int = 3, delay: int = 2) -> bool:
+# Shared session so checks against the same host reuse one keep-alive
+# connection instead of paying a new TCP/TLS handshake per request
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+_SESSION.headers.update({"Connection": "keep-alive"})
+
+
+def check_endpoint(url: str, retries: int = 3, delay: int = 2,
+                   session: requests.Session = _SESSION) -> bool:
     """
     Check a single endpoint with retries.
 
@@ -26,13 +37,14 @@ def check_endpoint(url: str, retries: int = 3, delay: int = 2) -> bool:
         url (str): Full URL to check (e.g., http://localhost:8000/health)
         retries (int): Number of retry attempts
         delay (int): Delay in seconds between retries
+        session (requests.Session): Session used for the requests
 
     Returns:
         bool: True if endpoint returns HTTP 200, False otherwise
     """
     for attempt in range(1, retries + 1):
         try:
-            response = requests.get(url, timeout=5)
+            response = session.get(url, timeout=5)
             if response.status_code == 200:
                 print(f"[OK] {url} responded with 200")
                 return True
@@ -57,11 +69,19 @@ def main():
     endpoints = ["/health", "/ready"]
     all_ok = True
 
-    for ep in endpoints:
-        url = f"{args.host.rstrip('/')}{ep}"
-        if not check_endpoint(url, retries=args.retries, delay=args.delay):
-            print(f"[FAIL] {ep} did not respond with 200 after {args.retries} attempts")
-            all_ok = False
+    base = args.host.rstrip('/')
+
+    # Checks are I/O-bound, so run them concurrently: total time is the
+    # slowest endpoint rather than the sum of all retry timelines
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        futures = {
+            executor.submit(check_endpoint, f"{base}{ep}", args.retries, args.delay, _SESSION): ep
+            for ep in endpoints
+        }
+        for future in as_completed(futures):
+            if not future.result():
+                print(f"[FAIL] {futures[future]} did not respond with 200 after {args.retries} attempts")
+                all_ok = False
 
     if all_ok:
         print("[SUCCESS] All endpoints healthy and ready.")
@@ -0,0 +1,123 @@
+"""
+Shared pytest fixtures for the CV AI Agent test suite.
+
+The Flask application is built once per distinct test config (per xdist
+worker) and shared by every test module; each test gets its own test client
+and application context.
+
+Log records are collected by a single list-backed handler installed once
+per session instead of pytest's caplog, which installs and tears down a
+capture handler for every test (the logging plugin is disabled in
+pytest.ini with `-p no:logging`).
+
+The application is imported through the cv_ai_agent package, the same way
+wsgi.py does, so the project must be installed first (pip install -e .).
+The app is always built with TestingConfig, which needs no real secrets.
+"""
+
+import pytest
+import logging
+from functools import lru_cache
+from cv_ai_agent.app import create_app
+from cv_ai_agent.config import TestingConfig
+
+# Capture INFO and above for the whole session. Set once at import instead
+# of per test, so the client fixture needs no log-level bookkeeping.
+logging.getLogger().setLevel(logging.INFO)
+logging.getLogger("app").setLevel(logging.INFO)
+
+
+@pytest.fixture(scope="session")
+def log_sink():
+    """
+    Installs one handler that appends every record to a plain list.
+
+    It is attached to the root logger and to the "app" logger, which does
+    not propagate to root (see _LOGGING_DICT in app.py).
+    """
+    handler = logging.Handler()
+    handler.records = []
+    handler.emit = handler.records.append
+
+    loggers = (logging.getLogger(), logging.getLogger("app"))
+    for logger in loggers:
+        logger.addHandler(handler)
+    yield handler
+    for logger in loggers:
+        logger.removeHandler(handler)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _cheap_log_output():
+    """
+    Reduces log emission cost for the test session.
+
+    - Werkzeug's per-request INFO lines are never asserted on, so drop them
+    - The app logger's console handlers only print the level name, skipping
+      the detailed timestamp/location formatting of every record
+    """
+    werkzeug_logger = logging.getLogger("werkzeug")
+    previous_level = werkzeug_logger.level
+    werkzeug_logger.setLevel(logging.WARNING)
+
+    handlers = list(logging.getLogger("app").handlers)
+    previous_formatters = [handler.formatter for handler in handlers]
+    level_only = logging.Formatter("%(levelname)s")
+    for handler in handlers:
+        handler.setFormatter(level_only)
+
+    yield
+
+    for handler, formatter in zip(handlers, previous_formatters):
+        handler.setFormatter(formatter)
+    werkzeug_logger.setLevel(previous_level)
+
+
+@pytest.fixture
+def captured_logs(log_sink):
+    """
+    Provides the list of log records emitted during the current test.
+    """
+    log_sink.records.clear()
+    yield log_sink.records
+
+
+# TestingConfig already provides TESTING and the shared in-memory DATABASE_URL
+_DEFAULT_APP_CONFIG = {}
+
+
+@lru_cache(maxsize=4)
+def _cached_app(config_items):
+    """
+    Builds the Flask application once per distinct config.
+    Keyed by the sorted config items so equal configs reuse one instance.
+    """
+    app = create_app(TestingConfig)
+    app.config.update(dict(config_items))
+    return app
+
+
+@pytest.fixture
+def app(request):
+    """
+    Provides a Flask application, reused across tests with the same config.
+
+    - Defaults to TestingConfig (shared in-memory SQLite DATABASE_URL)
+    - Override per test with indirect parametrization:
+      @pytest.mark.parametrize("app", [{...}], indirect=True)
+    - An application context is pushed for each test and popped afterwards
+    """
+    config = getattr(request, "param", _DEFAULT_APP_CONFIG)
+    app = _cached_app(tuple(sorted(config.items())))
+    with app.app_context():
+        yield app
+
+
+@pytest.fixture
+def client(app):
+    """
+    Provides a Flask test client on top of the shared application.
+    Tests that assert on logs request the `captured_logs` fixture.
+    """
+    with app.test_client() as client:
+        yield client
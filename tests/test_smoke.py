@@ -6,117 +6,163 @@ These tests validate that the application:
 - Handles its core endpoints without crashing
 - Emits meaningful logs during startup and request handling
 
-We use pytest's `caplog` fixture to ensure:
-- INFO logs are emitted for successful startup and normal request flows
+We use the `captured_logs` fixture (see conftest.py) to ensure:
+- INFO logs are emitted during application startup
+- Normal request flows do not emit WARNING or ERROR logs
 - WARNING or ERROR logs appear if failures are triggered
 
-Absolute imports are used so pytest can run from the project root without
-PYTHONPATH hacks, making this suite CI/CD safe on Windows, Linux, Docker,
-and GitHub Actions.
+The health endpoint checks that used to live in test_health.py are folded
+in here as parametrized cases. The `app` and `client` fixtures come from
+conftest.py and are shared with the rest of the suite.
 """
 
 import pytest
-import logging
-from app import create_app
+from datetime import date
+from flask import jsonify
+import cv_ai_agent.app as app_module
+from cv_ai_agent.app import create_app
+from cv_ai_agent.config import TestingConfig
 
 
-@pytest.fixture(scope="module")
-def client(caplog):
+def _has_log_level(records, *level_names: str) -> bool:
     """
-    Provides a Flask test client for smoke tests.
-
-    - Scope is module-level to simulate near-production usage
-    - Captures logs during app creation and request handling
-    - Ensures startup emits INFO-level logs
+    Helper: Check if at least one log record of the given levels exists.
+    We do not match exact messages to avoid fragile tests.
     """
-    caplog.set_level(logging.INFO)
-
-    # App creation itself should produce logs
-    app = create_app()
-    app.config["TESTING"] = True
+    return any(record.levelname in level_names for record in records)
 
-    with app.test_client() as client:
-        yield client
 
-
-def test_smoke_startup_and_health(client, caplog):
-    """
-    Verifies:
-    - The application responds on /health
-    - INFO logs are emitted during basic request handling
+def test_app_bootstraps_and_logs(client, captured_logs):
     """
+    Verify the application starts correctly, emits at least one INFO log
+    while bootstrapping, and serves the root endpoint.
 
-    response = client.get("/health")
-    assert response.status_code == 200
-    assert response.is_json
+    The shared app is built before per-test capture starts, so a fresh app
+    is created here to observe the startup logs.
+    """
+    create_app(TestingConfig)
 
-    data = response.get_json()
-    assert "status" in data
-    assert data["status"] in ["healthy", "ok", "up"]
+    # Logging verification
+    assert _has_log_level(captured_logs, "INFO"), "Expected at least one INFO log on app bootstrap"
 
-    # Logging verification: at least one INFO log must exist
-    assert any(
-        record.levelname == "INFO" for record in caplog.records
-    ), "Expected INFO logs during startup or /health request"
+    response = client.get("/")
+    assert response.status_code == 200
 
 
-def test_smoke_readiness_endpoint(client, caplog):
+@pytest.mark.parametrize("endpoint,key,accepted", [
+    pytest.param("/health", "status", ("healthy", "ok", "up"), id="health"),
+    pytest.param("/ready", "ready", (True,), id="ready"),
+])
+def test_smoke_probe_endpoints(client, endpoint, key, accepted):
     """
-    Verifies:
-    - The readiness endpoint responds correctly
-    - INFO logs are emitted for readiness checks
+    Verifies for each probe endpoint:
+    - Returns HTTP 200 with a JSON payload
+    - The payload carries the expected status key and value
     """
-
-    response = client.get("/ready")
+    response = client.get(endpoint)
     assert response.status_code == 200
     assert response.is_json
 
     data = response.get_json()
-    assert "ready" in data
-    assert data["ready"] is True
-
-    # Logging verification
-    assert any(
-        record.levelname == "INFO" for record in caplog.records
-    ), "Expected INFO logs for /ready endpoint"
+    assert key in data
+    assert data[key] in accepted
 
 
-def test_smoke_logging_presence(client, caplog):
+def test_smoke_probe_headers(app, client):
     """
-    Ensures that logs are consistently produced for basic application activity.
+    Verifies the probe short-circuit sends the same service headers as
+    after_request, plus Content-Length and the short-lived Cache-Control.
 
-    This test does not depend on exact message text, only that:
-    - Logs exist
-    - They contain meaningful severity levels
+    An outer middleware appends a header, as PEP 3333 allows; repeated
+    probes must not accumulate it in the prebuilt header list.
     """
-
-    # Trigger a few standard requests
-    client.get("/health")
-    client.get("/ready")
-    client.get("/")
-
-    # At least some logs must exist
-    assert len(caplog.records) > 0, "Expected logs to be generated during smoke tests"
-
-    # Ensure we have INFO logs for normal flows
-    assert any(
-        record.levelname == "INFO" for record in caplog.records
-    ), "Expected INFO logs during normal request handling"
+    probe_wsgi_app = app.wsgi_app
+
+    def request_id_middleware(environ, start_response):
+        def add_request_id(status, headers, exc_info=None):
+            headers.append(("X-Request-Id", "test"))
+            return start_response(status, headers, exc_info)
+        return probe_wsgi_app(environ, add_request_id)
+
+    app.wsgi_app = request_id_middleware
+    try:
+        for _ in range(3):
+            response = client.get("/health")
+            assert response.headers["X-Service"] == "CV-AI-Agent"
+            assert response.headers["X-Version"] == "1.0.0"
+            assert response.headers["Content-Length"] == str(len(response.data))
+            assert response.headers["Cache-Control"] == "max-age=1, public"
+            assert response.headers.getlist("X-Request-Id") == ["test"]
+    finally:
+        app.wsgi_app = probe_wsgi_app
+
+
+def test_json_provider_keeps_http_dates(app):
+    """
+    Verifies the orjson provider keeps Flask's HTTP-date format for dates.
+    """
+    response = jsonify(d=date(2020, 1, 2))
+    assert response.get_json() == {"d": "Thu, 02 Jan 2020 00:00:00 GMT"}
 
 
-def test_smoke_failure_logging(client, caplog):
+def test_unhandled_exception_traceback_is_rate_limited(captured_logs, monkeypatch):
     """
-    Verifies that incorrect endpoints trigger WARNING or ERROR logs.
-
-    This confirms that the application logs failure scenarios properly,
-    which is critical for production observability.
+    Verifies log_exception() formats the traceback only for the first of
+    two quick failures of the same exception class; the second logs the
+    single "(traceback suppressed)" line instead.
     """
+    # The rate-limit state is module-global and shared by every app
+    monkeypatch.setattr(app_module, "_LAST_TRACEBACK", {})
+    failing_app = create_app(TestingConfig)
+    failing_app.config["PROPAGATE_EXCEPTIONS"] = False
+
+    @failing_app.route("/boom")
+    def boom():
+        raise ValueError("boom")
+
+    client = failing_app.test_client()
+    assert client.get("/boom").status_code == 500
+    assert client.get("/boom").status_code == 500
+
+    errors = [
+        record for record in captured_logs
+        if record.name == "cv_ai_agent.app" and record.levelname == "ERROR"
+    ]
+    assert len(errors) == 2
+    assert errors[0].exc_info is not None
+    assert errors[1].exc_info is None
+    assert "(traceback suppressed)" in errors[1].getMessage()
+
+
+# One case per request, so a failure names the request and its captured logs
+# hold only that request's records. Under CI's --dist=loadfile all
+# cases still run on the same xdist worker as the rest of this file.
+@pytest.mark.parametrize("method,path,payload,status,expect_failure_log", [
+    pytest.param("GET", "/health", None, 200, False, id="health"),
+    pytest.param("GET", "/ready", None, 200, False, id="ready"),
+    pytest.param("GET", "/", None, 200, False, id="root"),
+    pytest.param("GET", "/this-endpoint-does-not-exist", None, 404, True, id="not-found"),
+    pytest.param("POST", "/", None, 405, True, id="method-not-allowed"),
+])
+def test_smoke_logging_presence(client, captured_logs, method, path, payload, status, expect_failure_log):
+    """
+    Ensures that application activity is logged at sensible severities.
 
-    response = client.get("/this-endpoint-does-not-exist")
-    assert response.status_code == 404
-    assert response.is_json
-
-    # Logging verification for failure case
-    assert any(
-        record.levelname in ("WARNING", "ERROR") for record in caplog.records
-    ), "Expected WARNING or ERROR logs for invalid endpoint access"
+    This test does not depend on exact message text, only that:
+    - Normal request flows do not raise WARNING or ERROR records
+    - Incorrect endpoints return a JSON error payload and do trigger
+      WARNING or ERROR records, which is critical for production observability
+    """
+    response = client.open(path, method=method, json=payload)
+    assert response.status_code == status
+
+    if expect_failure_log:
+        assert response.is_json
+        data = response.get_json()
+        assert any(key in data for key in ("error", "message", "status"))
+
+        # Logging verification for failure case
+        assert _has_log_level(captured_logs, "WARNING", "ERROR"), f"Expected WARNING or ERROR logs for {method} {path}"
+    else:
+        # Normal flows must not look like failures in the logs
+        assert not _has_log_level(captured_logs, "WARNING", "ERROR"), f"Unexpected WARNING/ERROR logs for {method} {path}"
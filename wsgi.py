@@ -4,16 +4,15 @@ Production entry point for scalable WSGI server deployment.
 """
 
 import os
-import sys
 
 # -----------------------------------------------------------------------------
 # ENVIRONMENT SETUP
 # -----------------------------------------------------------------------------
 
-# Add project root to Python path for reliable imports
+# Project root (used to locate .env). sys.path is deliberately left alone:
+# the cv_ai_agent package must be importable (installed, or its parent
+# directory on PYTHONPATH), which keeps import lookups short at worker boot.
 project_root = os.path.dirname(os.path.abspath(__file__))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
 
 # -----------------------------------------------------------------------------
 # ENVIRONMENT VARIABLE LOADING
@@ -21,22 +20,28 @@ if project_root not in sys.path:
 
 # Load environment variables from .env file if it exists
 # Production environments should set variables directly, not via .env
-try:
-    from dotenv import load_dotenv
-    # Load .env from project root, but don't fail if missing
-    dotenv_path = os.path.join(project_root, '.env')
-    load_dotenv(dotenv_path=dotenv_path, verbose=False)
-except ImportError:
-    # python-dotenv not installed (unlikely in production)
-    pass
+# With preload_app (gunicorn.conf.py) this runs once in the master and forked
+# workers inherit os.environ; DOTENV_LOADED guards any re-import/reload.
+dotenv_path = os.path.join(project_root, '.env')
+env_name = (os.environ.get('FLASK_ENV') or os.environ.get('APP_ENV', 'development')).lower()
+if (env_name != 'production'
+        and os.environ.get('DOTENV_LOADED') != '1'
+        and os.path.exists(dotenv_path)):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(dotenv_path=dotenv_path, verbose=False)
+        os.environ['DOTENV_LOADED'] = '1'
+    except ImportError:
+        # python-dotenv not installed (unlikely in production)
+        pass
 
 # -----------------------------------------------------------------------------
 # FLASK APPLICATION FACTORY IMPORT
 # -----------------------------------------------------------------------------
 
 # Import the Flask application factory
-# Using absolute import pattern for reliability
-from app import create_app
+# Using absolute package import (app.py uses package-relative imports)
+from cv_ai_agent.app import create_app
 
 # -----------------------------------------------------------------------------
 # APPLICATION INSTANCE
@@ -44,6 +49,8 @@ from app import create_app
 
 # Create the Flask application instance
 # This object is what Gunicorn will use as the WSGI application
+# With preload_app it is created once in the Gunicorn master and shared by
+# forked workers, so it must not open sockets or DB connections at import.
 application = create_app()
 
 # -----------------------------------------------------------------------------
@@ -62,5 +69,5 @@ if __name__ == '__main__':
     
     # Run development server (not for production use)
     print(f"⚠️  Development server starting on http://{host}:{port}")
-    print(f"⚠️  For production, use: gunicorn --bind {host}:{port} wsgi:application")
+    print(f"⚠️  For production, use: gunicorn --bind {host}:{port} cv_ai_agent.wsgi:application")
     application.run(host=host, port=port, debug=debug)
\ No newline at end of file